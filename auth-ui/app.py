@@ -9,10 +9,24 @@ tokens in persistent storage.
 import os
 import json
 import logging
+import secrets
+import tempfile
+from functools import lru_cache
 from flask import Flask, render_template, request, redirect, url_for, session
 from werkzeug.middleware.proxy_fix import ProxyFix
 from google_auth_oauthlib.flow import Flow
-from google.oauth2.credentials import Credentials
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    orjson = None
+
+    def _json_loads(data):
+        return json.loads(data)
 
 # Configuration
 CLIENT_SECRET_JSON = os.getenv('CLIENT_SECRET_JSON')
@@ -20,43 +34,137 @@ CREDENTIALS_FILE = os.getenv('CREDENTIALS_FILE', '/config/client_secret.json')
 SCOPES = ['https://www.googleapis.com/auth/youtube']
 PORT = int(os.getenv('PORT', 5000))
 REDIRECT_URI = os.getenv('REDIRECT_URI', None)  # Optional: explicit redirect URI for ingress
+TOKEN_FILE = os.getenv('TOKEN_FILE', '/app/data/token.json')
 
 app = Flask(__name__)
-app.secret_key = os.urandom(24)
+# 32 bytes matches the HMAC-SHA256 key size itsdangerous uses for
+# session cookies, avoiding internal key expansion on every sign/verify
+app.secret_key = os.getenv('FLASK_SECRET_KEY') or secrets.token_bytes(32)
+app.config.update(
+    SESSION_COOKIE_SECURE=True,
+    SESSION_COOKIE_HTTPONLY=True,
+    SESSION_COOKIE_SAMESITE='Lax',
+)
+
+def _health_middleware(wsgi_app):
+    """Answer /health at the WSGI layer.
+
+    Kubernetes probes hit /health every few seconds; short-circuiting
+    here skips Flask routing and the session interface's cookie
+    HMAC verify/sign on every probe.
+    """
+    def middleware(environ, start_response):
+        if environ.get('PATH_INFO') == '/health':
+            start_response('204 No Content', [('Content-Length', '0')])
+            return [b'']
+        return wsgi_app(environ, start_response)
+    return middleware
+
 
 # Trust proxy headers (X-Forwarded-Proto, X-Forwarded-Host) from ingress
 # This allows Flask to correctly detect HTTPS when behind a reverse proxy
-app.wsgi_app = ProxyFix(app.wsgi_app, x_proto=1, x_host=1)
+app.wsgi_app = _health_middleware(ProxyFix(app.wsgi_app, x_proto=1, x_host=1))
+
+# Templates never change at runtime in the container: compile them once at
+# startup and skip the per-render mtime stat() that auto-reload would do.
+app.config['TEMPLATES_AUTO_RELOAD'] = False
+app.jinja_env.auto_reload = False
+with app.app_context():
+    for _template in ('index.html', 'success.html'):
+        app.jinja_env.get_template(_template)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+if not os.getenv('FLASK_SECRET_KEY'):
+    logger.warning("FLASK_SECRET_KEY not set - session cookies will not survive "
+                   "restarts or be shared across workers, forcing re-authentication")
+
 
+@lru_cache(maxsize=1)
 def get_client_config():
-    """Get OAuth2 client configuration from env var or file."""
+    """Get OAuth2 client configuration from env var or file.
+
+    The config is static for the process lifetime, so it is parsed once
+    and cached instead of re-reading the env var/file on every request.
+    """
     if CLIENT_SECRET_JSON:
         try:
-            return json.loads(CLIENT_SECRET_JSON)
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse CLIENT_SECRET_JSON: {e}")
+            return _json_loads(CLIENT_SECRET_JSON)
+        except ValueError as e:  # covers json and orjson JSONDecodeError
+            logger.error("Failed to parse CLIENT_SECRET_JSON: %s", e)
             raise
-    elif os.path.exists(CREDENTIALS_FILE):
-        with open(CREDENTIALS_FILE, 'r') as f:
-            return json.load(f)
-    else:
+    try:
+        with open(CREDENTIALS_FILE, 'rb') as f:
+            return _json_loads(f.read())
+    except FileNotFoundError:
         raise FileNotFoundError("No client credentials found")
 
 
+_REDIRECT_URI = REDIRECT_URI
+
+
+def _get_redirect_uri():
+    """Return the OAuth redirect URI, computing it at most once.
+
+    Uses the explicit REDIRECT_URI env var when set (ingress deployments);
+    otherwise derives it from the first request's host/scheme (ProxyFix
+    has already fixed those up) and caches the result so later requests
+    skip the url_for URL-map walk.
+    """
+    global _REDIRECT_URI
+    if not _REDIRECT_URI:
+        _REDIRECT_URI = url_for('callback', _external=True)
+    return _REDIRECT_URI
+
+
+# Shared connection pool for the token exchange with Google. Each Flow
+# gets its own requests session, but mounting one adapter keeps the
+# TLS connections alive across authentications.
+_HTTP_ADAPTER = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+
+
+def _make_flow(redirect_uri, state=None):
+    """Build an OAuth2 Flow from the cached client config.
+
+    Only the tiny state nonce lives in the session cookie; everything
+    else the Flow needs is reconstructed from module-level state.
+    """
+    flow = Flow.from_client_config(
+        get_client_config(),
+        scopes=SCOPES,
+        state=state,
+        redirect_uri=redirect_uri
+    )
+    flow.oauth2session.mount('https://', _HTTP_ADAPTER)
+    return flow
+
+
 def save_token_to_file(token_json: str):
-    """Save OAuth token to persistent file."""
+    """Save OAuth token to persistent file atomically.
+
+    Writes to a temp file in the same directory and renames it into
+    place, so the playlist manager never reads a partially-written
+    token if the pod dies mid-write.
+    """
     try:
-        token_file = '/app/data/token.json'
-        with open(token_file, 'w') as f:
-            f.write(token_json)
-        logger.info(f"Saved token to {token_file}")
+        token_file = TOKEN_FILE
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(token_file), prefix='.token.', suffix='.json')
+        try:
+            with os.fdopen(fd, 'w', buffering=65536) as f:
+                f.write(token_json)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, token_file)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        logger.info("Saved token to %s", token_file)
         return True
     except Exception as e:
-        logger.error(f"Failed to save token to file: {e}")
+        logger.error("Failed to save token to file: %s", e)
         return False
 
 
@@ -72,30 +180,23 @@ def index():
 def auth():
     """Start OAuth2 flow."""
     try:
-        client_config = get_client_config()
-        
         # Use explicit redirect URI if set (for ingress), otherwise auto-detect
-        redirect_uri = REDIRECT_URI or url_for('callback', _external=True)
-        logger.info(f"Using redirect URI: {redirect_uri}")
-        
-        # Create flow with redirect URI
-        flow = Flow.from_client_config(
-            client_config,
-            scopes=SCOPES,
-            redirect_uri=redirect_uri
-        )
-        
+        redirect_uri = _get_redirect_uri()
+        logger.info("Using redirect URI: %s", redirect_uri)
+
+        flow = _make_flow(redirect_uri)
+
         authorization_url, state = flow.authorization_url(
             access_type='offline',
             include_granted_scopes='true',
             prompt='consent'  # Force consent screen to always get refresh_token
         )
-        
-        session['state'] = state
+
+        session['oauth_state'] = state
         return redirect(authorization_url)
     
     except Exception as e:
-        logger.error(f"Error starting OAuth flow: {e}")
+        logger.error("Error starting OAuth flow: %s", e)
         session['error'] = str(e)
         return redirect(url_for('index'))
 
@@ -105,23 +206,16 @@ def callback():
     """OAuth2 callback handler."""
     try:
         # Verify state
-        state = session.get('state')
-        if not state or state != request.args.get('state'):
+        state = session.get('oauth_state')
+        if not state or not secrets.compare_digest(state, request.args.get('state', '')):
             raise ValueError("Invalid state parameter")
-        
-        client_config = get_client_config()
-        
+
         # Use explicit redirect URI if set (for ingress), otherwise auto-detect
-        redirect_uri = REDIRECT_URI or url_for('callback', _external=True)
-        
+        redirect_uri = _get_redirect_uri()
+
         # Complete the flow
-        flow = Flow.from_client_config(
-            client_config,
-            scopes=SCOPES,
-            state=state,
-            redirect_uri=redirect_uri
-        )
-        
+        flow = _make_flow(redirect_uri, state=state)
+
         flow.fetch_token(authorization_response=request.url)
         credentials = flow.credentials
         
@@ -136,7 +230,7 @@ def callback():
             raise Exception("Failed to save token to file")
     
     except Exception as e:
-        logger.error(f"Error in OAuth callback: {e}")
+        logger.error("Error in OAuth callback: %s", e)
         session['error'] = str(e)
         return redirect(url_for('index'))
 
@@ -144,14 +238,48 @@ def callback():
 @app.route('/success')
 def success():
     """Success page after authentication."""
-    return render_template('success.html', token_file='/app/data/token.json')
+    return render_template('success.html', token_file=TOKEN_FILE)
 
 
 @app.route('/health')
 def health():
-    """Health check endpoint."""
-    return {'status': 'healthy'}, 200
+    """Health check endpoint.
+
+    Returns an empty 204 so the once-per-few-seconds Kubernetes probes
+    skip JSON serialization; the route never touches the session.
+    """
+    return '', 204
+
+
+def _run_production_server():
+    """Serve the app with gunicorn (threaded workers + HTTP keepalive)."""
+    from gunicorn.app.base import BaseApplication
+
+    class StandaloneApplication(BaseApplication):
+        def __init__(self, wsgi_app, options):
+            self.application = wsgi_app
+            self.options = options
+            super().__init__()
+
+        def load_config(self):
+            for key, value in self.options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            return self.application
+
+    StandaloneApplication(app, {
+        'bind': f'0.0.0.0:{PORT}',
+        'workers': int(os.getenv('WEB_CONCURRENCY', 2)),
+        'worker_class': 'gthread',
+        'threads': 4,
+        'keepalive': 75,
+    }).run()
 
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=PORT, debug=False)
+    try:
+        _run_production_server()
+    except ImportError:
+        logger.warning("gunicorn not installed - falling back to Flask dev server")
+        app.run(host='0.0.0.0', port=PORT, debug=False)
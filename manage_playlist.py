@@ -10,16 +10,27 @@ import sys
 import time
 import json
 import logging
+from logging.handlers import QueueHandler, QueueListener
 import argparse
 import shutil
 import smtplib
+import queue
+import atexit
+import signal
+import tempfile
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
+from datetime import datetime, timedelta
+from functools import partial
 from pathlib import Path
+from zoneinfo import ZoneInfo
 from typing import List, Dict, Optional
-from threading import Thread
+from threading import Thread, Lock, Event, local
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
+import httplib2
 import yt_dlp
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from google.auth.exceptions import GoogleAuthError
@@ -29,6 +40,17 @@ from google.oauth2.credentials import Credentials
 from dotenv import load_dotenv
 from prometheus_client import Counter, Gauge, Histogram, start_http_server
 
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    orjson = None
+
+    def _json_loads(data):
+        return json.loads(data)
+
 
 # Load environment variables
 load_dotenv()
@@ -42,9 +64,13 @@ DONE_PLAYLIST_ID = os.getenv('DONE_PLAYLIST_ID')
 FAILED_PLAYLIST_ID = os.getenv('FAILED_PLAYLIST_ID', '')  # Optional: playlist for permanently failed videos
 DOWNLOAD_PATH = Path(os.getenv('DOWNLOAD_PATH', './downloads'))
 POLL_INTERVAL = int(os.getenv('POLL_INTERVAL', 5))
+POLL_INTERVAL_MAX = int(os.getenv('POLL_INTERVAL_MAX') or 0)  # Max idle-backoff interval in seconds (0 = 64x POLL_INTERVAL)
 DOWNLOAD_MODE = os.getenv('DOWNLOAD_MODE', 'video').lower()  # 'video' or 'audio'
+DOWNLOAD_CONCURRENCY = int(os.getenv('DOWNLOAD_CONCURRENCY', 4))  # Parallel video downloads per cycle
 COOKIES_FILE = os.getenv('COOKIES_FILE', '')  # Optional: path to cookies.txt file
 COOKIES_CONTENT = os.getenv('COOKIES_CONTENT', '')  # Optional: cookies.txt content as string
+EXTERNAL_DOWNLOADER = os.getenv('EXTERNAL_DOWNLOADER', '')  # Optional: e.g. 'aria2c' for multi-connection downloads
+YTDLP_CONCURRENT_FRAGMENTS = int(os.getenv('YTDLP_CONCURRENT_FRAGMENTS', 4))  # Parallel DASH/HLS fragment fetches per video
 METRICS_PORT = int(os.getenv('METRICS_PORT', 8080))
 DOWNLOAD_RETRY_DELAY = int(os.getenv('DOWNLOAD_RETRY_DELAY', 60))  # Initial retry delay in seconds
 DOWNLOAD_RETRY_MAX_BACKOFF = int(os.getenv('DOWNLOAD_RETRY_MAX_BACKOFF', 3600))  # Max backoff time in seconds (default: 1 hour)
@@ -67,9 +93,13 @@ QUOTA_COSTS = {
     'playlistItems.list': 1,
     'playlistItems.insert': 50,
     'playlistItems.delete': 50,
+    'videos.list': 1,
 }
 DAILY_QUOTA_LIMIT = int(os.getenv('DAILY_QUOTA_LIMIT', 10000))
 
+# YouTube API quota resets at midnight Pacific Time
+_PACIFIC = ZoneInfo('America/Los_Angeles')
+
 # Prometheus metrics
 videos_processed_total = Counter(
     'yt_playlist_videos_processed_total',
@@ -107,7 +137,11 @@ playlist_videos_gauge = Gauge(
 processing_duration_seconds = Histogram(
     'yt_playlist_processing_duration_seconds',
     'Time spent processing videos',
-    ['operation']  # operation: download, api_call, full_cycle
+    ['operation'],  # operation: download, api_call, full_cycle
+    # Coarse buckets: downloads span seconds to minutes, so the default
+    # sub-second resolution only adds per-observe comparisons and
+    # scrape payload
+    buckets=(0.1, 0.5, 1, 5, 30, 120, 600, float('inf'))
 )
 
 last_processing_timestamp = Gauge(
@@ -119,17 +153,30 @@ last_processing_timestamp = Gauge(
 LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
 LOG_FILE = os.getenv('LOG_FILE', '/tmp/playlist_manager.log')
 
+# Hot-path log calls only enqueue the record; a background listener
+# thread owns the actual stream/file writes, so download workers never
+# block on disk I/O or serialize on the handler lock
+_log_queue = queue.SimpleQueue()
 logging.basicConfig(
     level=getattr(logging, LOG_LEVEL, logging.INFO),
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler(LOG_FILE)
-    ]
+    handlers=[QueueHandler(_log_queue)]
 )
+
+_log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+_log_handlers = [logging.StreamHandler(sys.stdout), logging.FileHandler(LOG_FILE)]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+_log_listener = QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logger = logging.getLogger(__name__)
 logger.info(f"Logging configured: level={LOG_LEVEL}, file={LOG_FILE}")
 
+# googleapiclient chatters about its file_cache/discovery cache at INFO
+logging.getLogger('googleapiclient.discovery_cache').setLevel(logging.WARNING)
+
 
 class QuotaTracker:
     """Track YouTube API quota usage."""
@@ -140,11 +187,7 @@ class QuotaTracker:
     
     def _get_next_reset_time(self):
         """Get timestamp of next quota reset (midnight Pacific Time)."""
-        from datetime import datetime, timedelta
-        import pytz
-        
-        pacific = pytz.timezone('America/Los_Angeles')
-        now = datetime.now(pacific)
+        now = datetime.now(_PACIFIC)
         tomorrow = now + timedelta(days=1)
         midnight = tomorrow.replace(hour=0, minute=0, second=0, microsecond=0)
         return midnight.timestamp()
@@ -198,6 +241,31 @@ class PlaylistManager:
         self.failed_playlist_id = failed_playlist_id
         self.youtube = None
         self.retry_state = {}  # Track retry state per video: {video_id: {attempt: int, next_retry: timestamp}}
+        self._api_lock = Lock()  # googleapiclient's HTTP transport is not thread-safe
+        self._pending_batch_ops = []  # Queued (operation, request, video) playlist mutations
+        self._playlist_cache = {}  # playlist_id -> {'etag': str, 'videos': list} for conditional GETs
+        self._known_items = set()  # playlist_item_ids seen in the previous cycle's fetch
+        self._base_ydl_opts = self._build_base_ydl_opts()
+        self._ydl_local = local()  # One long-lived YoutubeDL per worker thread
+        self._done_cache = None  # video_ids already downloaded; loaded from .done_ids on first cycle
+        self._precheck_rejects = {}  # video_id -> reason, from the availability pre-check
+        self._done_playlist_ids = None  # video_ids in the done playlist; seeded once, then kept current on inserts
+        self._done_ids_file = None
+        self._done_lock = Lock()  # Serializes .done_ids appends from worker threads
+
+        # Pre-bound metric children: resolving .labels() on every
+        # observation costs a dict lookup plus a lock acquisition, which
+        # adds up in the per-video and per-page hot paths
+        self._m_api_call = processing_duration_seconds.labels(operation='api_call')
+        self._m_download = processing_duration_seconds.labels(operation='download')
+        self._m_full_cycle = processing_duration_seconds.labels(operation='full_cycle')
+        self._c_api_list = api_calls_total.labels(operation='list')
+        self._c_api_insert = api_calls_total.labels(operation='insert')
+        self._c_api_delete = api_calls_total.labels(operation='delete')
+        self._c_dl_attempted = downloads_total.labels(status='attempted')
+        self._c_dl_success = downloads_total.labels(status='success')
+        self._c_dl_failed = downloads_total.labels(status='failed')
+
         self._init_youtube_client()
     
     def _get_credentials(self) -> Credentials:
@@ -208,7 +276,8 @@ class PlaylistManager:
         if os.path.exists(self.token_file):
             logger.info(f"Loading existing credentials from {self.token_file}")
             try:
-                creds = Credentials.from_authorized_user_file(self.token_file, SCOPES)
+                with open(self.token_file, 'rb') as token:
+                    creds = Credentials.from_authorized_user_info(_json_loads(token.read()), SCOPES)
             except ValueError as e:
                 # Token file exists but missing refresh_token - wait for re-authentication
                 if "missing fields refresh_token" in str(e):
@@ -229,9 +298,9 @@ class PlaylistManager:
                 if CLIENT_SECRET_JSON:
                     try:
                         logger.info("Loading client secret from CLIENT_SECRET_JSON environment variable")
-                        client_config = json.loads(CLIENT_SECRET_JSON)
+                        client_config = _json_loads(CLIENT_SECRET_JSON)
                         flow = InstalledAppFlow.from_client_config(client_config, SCOPES)
-                    except json.JSONDecodeError as e:
+                    except ValueError as e:  # covers json and orjson JSONDecodeError
                         logger.error(f"Failed to parse CLIENT_SECRET_JSON: {e}")
                         raise ValueError("CLIENT_SECRET_JSON must be valid JSON") from e
                 # Fall back to file-based credentials
@@ -251,10 +320,25 @@ class PlaylistManager:
             
             # Save credentials for next run
             logger.info(f"Saving credentials to {self.token_file}")
-            with open(self.token_file, 'w') as token:
-                token.write(creds.to_json())
-        
+            self._save_token(creds.to_json())
+
         return creds
+
+    def _save_token(self, token_json: str) -> None:
+        """Persist the serialized token, skipping no-op rewrites.
+
+        Refreshes that didn't rotate the token would otherwise dirty
+        token.json (and its backing volume) on every check. The write
+        goes through a temp file + rename so a crash mid-write can't
+        leave a torn token behind.
+        """
+        if token_json == getattr(self, '_last_token_json', None):
+            return
+        tmp_path = self.token_file + '.tmp'
+        with open(tmp_path, 'w') as token:
+            token.write(token_json)
+        os.replace(tmp_path, self.token_file)
+        self._last_token_json = token_json
     
     def _init_youtube_client(self) -> None:
         """Initialize YouTube API client with OAuth2."""
@@ -270,8 +354,23 @@ class PlaylistManager:
                     time.sleep(retry_delay)
                     retry_delay = min(retry_delay * 1.5, max_delay)  # Exponential backoff
                     continue
-                
-                self.youtube = build('youtube', 'v3', credentials=creds)
+
+                self._creds = creds
+                # One explicit transport with keep-alive instead of the
+                # implicit per-request httplib2.Http googleapiclient
+                # would build, so every list/insert/delete and batch
+                # reuses the same TLS connection to the API frontend.
+                # All execute() calls serialize on _api_lock, so a
+                # single shared transport is safe.
+                # static_discovery serves the bundled discovery document
+                # instead of fetching ~200KB over the network at startup
+                self.youtube = build(
+                    'youtube', 'v3',
+                    http=AuthorizedHttp(creds, http=httplib2.Http(timeout=30)),
+                    static_discovery=True)
+                # playlistItems() rebuilds the method object from the
+                # discovery schema on every call; resolve it once
+                self._playlist_items = self.youtube.playlistItems()
                 logger.info("YouTube API client initialized successfully with OAuth2")
                 return
             except Exception as e:
@@ -280,54 +379,126 @@ class PlaylistManager:
                 time.sleep(retry_delay)
                 retry_delay = min(retry_delay * 1.5, max_delay)
     
+    def _ensure_fresh_credentials(self) -> None:
+        """
+        Proactively refresh OAuth credentials that are about to expire.
+
+        Refreshing before the token lapses avoids an API call failing
+        with 401 mid-cycle (which still costs quota) and the retry
+        round-trip that follows.
+        """
+        creds = getattr(self, '_creds', None)
+        if not creds or not creds.expiry or not creds.refresh_token:
+            return
+
+        remaining = (creds.expiry - datetime.utcnow()).total_seconds()
+        if remaining < 300:
+            logger.info(f"Access token expires in {int(remaining)}s - refreshing proactively")
+            try:
+                creds.refresh(Request())
+                self._save_token(creds.to_json())
+            except Exception as e:
+                logger.warning(f"Proactive credential refresh failed: {e}")
+
+    def _list_playlist_page(self, playlist_id: str, page_token: Optional[str],
+                            if_none_match: Optional[str] = None) -> Dict:
+        """Execute a single playlistItems.list page request."""
+        request = self._playlist_items.list(
+            part='snippet',
+            playlistId=playlist_id,
+            maxResults=50,
+            pageToken=page_token,
+            # Partial response: only the fields we actually consume,
+            # dropping thumbnails/descriptions/localizations from the
+            # payload (responses are gzip-compressed by the transport).
+            # pageInfo/totalResults is kept so an append to a later
+            # page still changes page 1's representation and
+            # invalidates the cached ETag
+            fields='etag,nextPageToken,pageInfo/totalResults,items(id,snippet(title,resourceId/videoId))'
+        )
+        if if_none_match:
+            # Conditional GET: the server answers 304 with no body
+            # when the playlist is unchanged since this etag
+            request.headers['If-None-Match'] = if_none_match
+        logger.debug(f"Making API request to playlistItems.list with playlistId={playlist_id}")
+
+        with self._m_api_call.time():
+            with self._api_lock:
+                response = request.execute()
+
+        # Track API usage
+        self._c_api_list.inc()
+        quota_tracker.add_usage('playlistItems.list')
+        return response
+
+    CACHE_REVALIDATE_CYCLES = 10  # Force a full refetch after this many consecutive 304s
+
     def get_playlist_videos(self, playlist_id: str) -> List[Dict[str, str]]:
         """
         Fetch all videos from a playlist.
-        
+
         Args:
             playlist_id: YouTube playlist ID
-            
+
         Returns:
             List of video dictionaries with id, title, and video_id
         """
         videos = []
-        next_page_token = None
-        
+        cached = self._playlist_cache.get(playlist_id)
+
+        # The conditional GET only validates page 1; a same-count edit on
+        # a later page leaves page 1's representation (and etag) intact,
+        # so don't trust the 304 path indefinitely - refetch
+        # unconditionally every CACHE_REVALIDATE_CYCLES consecutive hits
+        use_cache = cached is not None and cached['hits'] < self.CACHE_REVALIDATE_CYCLES
+
         logger.info(f"Attempting to fetch videos from playlist: {playlist_id}")
-        
+
         try:
-            while True:
-                request = self.youtube.playlistItems().list(
-                    part='snippet',
-                    playlistId=playlist_id,
-                    maxResults=50,
-                    pageToken=next_page_token
-                )
-                logger.debug(f"Making API request to playlistItems.list with playlistId={playlist_id}")
-                
-                with processing_duration_seconds.labels(operation='api_call').time():
-                    response = request.execute()
-                
-                # Track API usage
-                api_calls_total.labels(operation='list').inc()
-                quota_tracker.add_usage('playlistItems.list')
-                
-                logger.debug(f"API response received. Items count: {len(response.get('items', []))}")
-                
-                for item in response.get('items', []):
-                    videos.append({
-                        'playlist_item_id': item['id'],
-                        'video_id': item['snippet']['resourceId']['videoId'],
-                        'title': item['snippet']['title'],
-                        'video_url': f"https://www.youtube.com/watch?v={item['snippet']['resourceId']['videoId']}"
-                    })
-                
-                next_page_token = response.get('nextPageToken')
-                if not next_page_token:
-                    break
-            
+            try:
+                response = self._list_playlist_page(
+                    playlist_id, None, if_none_match=cached['etag'] if use_cache else None)
+            except HttpError as e:
+                if e.resp.status == 304 and use_cache:
+                    logger.debug(f"Playlist {playlist_id} unchanged (etag match) - using cached listing")
+                    cached['hits'] += 1
+                    self._c_api_list.inc()
+                    quota_tracker.add_usage('playlistItems.list')
+                    if playlist_id == self.todo_playlist_id:
+                        playlist_videos_gauge.set(len(cached['videos']))
+                    return list(cached['videos'])
+                raise
+
+            first_page_etag = response.get('etag')
+
+            # Prefetch each next page on a background thread while the
+            # current page is being parsed, overlapping the HTTPS
+            # round-trip with the Python-side work
+            with ThreadPoolExecutor(max_workers=1) as prefetch:
+                while True:
+                    next_page_token = response.get('nextPageToken')
+                    future = (prefetch.submit(self._list_playlist_page, playlist_id, next_page_token)
+                              if next_page_token else None)
+
+                    logger.debug(f"API response received. Items count: {len(response.get('items', []))}")
+
+                    for item in response.get('items', []):
+                        videos.append({
+                            'playlist_item_id': item['id'],
+                            'video_id': item['snippet']['resourceId']['videoId'],
+                            'title': item['snippet']['title'],
+                            'video_url': f"https://www.youtube.com/watch?v={item['snippet']['resourceId']['videoId']}"
+                        })
+
+                    if future is None:
+                        break
+                    response = future.result()
+
             logger.info(f"Retrieved {len(videos)} videos from playlist {playlist_id}")
-            playlist_videos_gauge.set(len(videos))
+            if first_page_etag:
+                self._playlist_cache[playlist_id] = {'etag': first_page_etag, 'videos': list(videos), 'hits': 0}
+            if playlist_id == self.todo_playlist_id:
+                playlist_videos_gauge.set(len(videos))
             return videos
             
         except HttpError as e:
@@ -437,7 +608,7 @@ The video has been moved to the failed playlist and will no longer be retried.
                 # Clear retry state on success
                 if video_id in self.retry_state:
                     del self.retry_state[video_id]
-                    logger.info(f"Download succeeded after {current_attempt} previous failure(s)")
+                    logger.debug("Download succeeded after %d previous failure(s)", current_attempt)
                 return True
                 
         except Exception as e:
@@ -462,7 +633,7 @@ The video has been moved to the failed playlist and will no longer be retried.
                     if video_id in self.retry_state:
                         del self.retry_state[video_id]
                     
-                    downloads_total.labels(status='failed').inc()
+                    self._c_dl_failed.inc()
                     # Return special marker to indicate permanent failure
                     return 'permanent_failure'
                 else:
@@ -483,105 +654,154 @@ The video has been moved to the failed playlist and will no longer be retried.
                 f"Will retry in {delay}s ({delay//60}min) at next cycle after {time.strftime('%H:%M:%S', time.localtime(next_retry_time))}."
             )
             
-            downloads_total.labels(status='failed').inc()
+            self._c_dl_failed.inc()
             return False
         
         return False
     
-    def _attempt_download(self, video: Dict[str, str], download_path: Path) -> bool:
+    @staticmethod
+    def _normalize_cookies(content: str) -> str:
+        """Normalize cookies.txt content to tab-separated Netscape format."""
+        # Netscape cookies format requires tabs, not spaces, but preserve
+        # spaces within cookie values (last field)
+        lines = []
+        for line in content.strip().split('\n'):
+            if line.startswith('#') or not line.strip():
+                lines.append(line)  # Keep comments and empty lines as-is
+            else:
+                # Split on whitespace, but only first 6 fields should be tab-separated
+                parts = line.split(None, 6)  # Split max 7 fields
+                if len(parts) == 7:
+                    # Rejoin with tabs: domain, flag, path, secure, expiration, name, value
+                    lines.append('\t'.join(parts))
+                else:
+                    lines.append(line)  # Keep malformed lines as-is for debugging
+        return '\n'.join(lines)
+
+    def _build_base_ydl_opts(self) -> Dict:
         """
-        Attempt to download a video once (used by download_video for retries).
-        
-        Args:
-            video: Video dictionary with url and metadata
-            download_path: Directory to save downloaded videos
-            
-        Returns:
-            True if download successful, False otherwise
+        Build the yt-dlp options shared by every download.
+
+        DOWNLOAD_MODE, the Node.js runtime and cookies are process-wide
+        constants, so resolve them once here instead of per video; the
+        hot path only has to fill in the output template.
         """
         # Configure format based on download mode
         if DOWNLOAD_MODE == 'audio':
             format_string = 'bestaudio[ext=m4a]/bestaudio'
-            logger.debug(f"Download mode: audio-only (original format)")
+            logger.debug("Download mode: audio-only (original format)")
         else:
             format_string = 'bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best'
-            logger.debug(f"Download mode: full video")
-        
+            logger.debug("Download mode: full video")
+
         # Detect Node.js path for JavaScript runtime support
         node_path = shutil.which('node')
         if node_path:
             logger.debug(f"Found Node.js at: {node_path}")
         else:
             logger.warning("Node.js not found in PATH - some videos may fail to download")
-        
+
         ydl_opts = {
             'format': format_string,
-            'outtmpl': str(download_path / '%(title)s.%(ext)s'),
-            'quiet': False,
+            'quiet': True,  # Per-fragment progress floods stdout at scale
             'no_warnings': False,
             'ignoreerrors': False,
             'nocheckcertificate': True,
             'retries': 10,
             'fragment_retries': 10,
-            'verbose': True,  # Enable verbose output for debugging
+            # Segmented (DASH/HLS) media is network-latency bound per
+            # fragment; fetching several in parallel with larger HTTP
+            # chunks keeps the pipe full
+            'concurrent_fragment_downloads': YTDLP_CONCURRENT_FRAGMENTS,
+            'http_chunk_size': 10 * 1024 * 1024,
         }
-        
+
         # Configure Node.js runtime if available (for JavaScript extraction)
         if node_path:
             ydl_opts['js_runtimes'] = {'node': {'path': node_path}}
-        
+
+        # Optionally delegate byte transfer to an external downloader;
+        # aria2c opens up to 16 parallel connections per file, which
+        # beats yt-dlp's single-stream HTTP downloader on fat pipes
+        if EXTERNAL_DOWNLOADER:
+            if shutil.which(EXTERNAL_DOWNLOADER):
+                ydl_opts['external_downloader'] = EXTERNAL_DOWNLOADER
+                if EXTERNAL_DOWNLOADER == 'aria2c':
+                    ydl_opts['external_downloader_args'] = {
+                        'aria2c': ['-x16', '-s16', '-k1M', '--console-log-level=warn']
+                    }
+                logger.info(f"Using external downloader: {EXTERNAL_DOWNLOADER}")
+            else:
+                logger.warning(f"EXTERNAL_DOWNLOADER={EXTERNAL_DOWNLOADER} not found in PATH - using built-in downloader")
+
         # Add cookies if provided (helps bypass bot detection)
-        cookies_temp_file = None
         if COOKIES_CONTENT:
-            # Write cookies content to temp file
-            import tempfile
-            import re
-            
-            # Normalize cookie format: convert multiple spaces to single tab
-            # Netscape cookies format requires tabs, not spaces
-            normalized_cookies = re.sub(r'\s+', '\t', COOKIES_CONTENT.strip())
-            # But preserve spaces within cookie values (last field)
-            # Split each line and rejoin with tabs for first 6 fields, keep rest as-is
-            lines = []
-            for line in COOKIES_CONTENT.strip().split('\n'):
-                if line.startswith('#') or not line.strip():
-                    lines.append(line)  # Keep comments and empty lines as-is
-                else:
-                    # Split on whitespace, but only first 6 fields should be tab-separated
-                    parts = line.split(None, 6)  # Split max 7 fields
-                    if len(parts) == 7:
-                        # Rejoin with tabs: domain, flag, path, secure, expiration, name, value
-                        lines.append('\t'.join(parts))
-                    else:
-                        lines.append(line)  # Keep malformed lines as-is for debugging
-            
-            normalized_cookies = '\n'.join(lines)
-            
+            # Write normalized cookies content to a temp file that lives
+            # for the whole process instead of one per download
             cookies_temp_file = tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False)
-            cookies_temp_file.write(normalized_cookies)
+            cookies_temp_file.write(self._normalize_cookies(COOKIES_CONTENT))
             cookies_temp_file.close()
+            atexit.register(self._cleanup_cookies_file, cookies_temp_file.name)
             ydl_opts['cookiefile'] = cookies_temp_file.name
-            logger.debug(f"Using cookies from COOKIES_CONTENT environment variable (normalized {len(lines)} lines)")
+            logger.debug("Using cookies from COOKIES_CONTENT environment variable")
         elif COOKIES_FILE and os.path.exists(COOKIES_FILE):
             ydl_opts['cookiefile'] = COOKIES_FILE
             logger.debug(f"Using cookies from file: {COOKIES_FILE}")
-        
-        try:
-            logger.info(f"Downloading: {video['title']}")
-            downloads_total.labels(status='attempted').inc()
-            
-            with processing_duration_seconds.labels(operation='download').time():
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                    ydl.download([video['video_url']])
-            
-            logger.info(f"Successfully downloaded: {video['title']}")
-            downloads_total.labels(status='success').inc()
-            return True
-            
-        finally:
-            # Clean up temp cookies file if created
-            if cookies_temp_file and os.path.exists(cookies_temp_file.name):
-                os.unlink(cookies_temp_file.name)
+
+        return ydl_opts
+
+    @staticmethod
+    def _cleanup_cookies_file(path: str) -> None:
+        """Remove the process-lifetime cookies temp file on exit."""
+        if os.path.exists(path):
+            os.unlink(path)
+
+    def _get_thread_ydl(self, download_path: Path) -> yt_dlp.YoutubeDL:
+        """
+        Get (lazily creating) the calling worker thread's YoutubeDL.
+
+        Constructing YoutubeDL loads extractors and opens fresh HTTP
+        connection pools, so one long-lived instance per thread keeps
+        connections and extractor caches warm across downloads. Only
+        the output template varies per call.
+        """
+        ydl = getattr(self._ydl_local, 'ydl', None)
+        outtmpl = str(download_path / '%(title)s.%(ext)s')
+        if ydl is None:
+            ydl = yt_dlp.YoutubeDL({**self._base_ydl_opts, 'outtmpl': outtmpl})
+            self._ydl_local.ydl = ydl
+        else:
+            ydl.params['outtmpl'] = {'default': outtmpl}
+        return ydl
+
+    def _attempt_download(self, video: Dict[str, str], download_path: Path) -> bool:
+        """
+        Attempt to download a video once (used by download_video for retries).
+
+        Args:
+            video: Video dictionary with url and metadata
+            download_path: Directory to save downloaded videos
+
+        Returns:
+            True if download successful, False otherwise
+        """
+        # Flagged by the availability pre-check: fail without touching
+        # the network so the retry/threshold machinery still runs
+        reject_reason = self._precheck_rejects.get(video['video_id'])
+        if reject_reason:
+            raise RuntimeError(f"Video is {reject_reason} (availability pre-check)")
+
+        ydl = self._get_thread_ydl(download_path)
+
+        logger.debug("Downloading: %s", video['title'])
+        self._c_dl_attempted.inc()
+
+        with self._m_download.time():
+            ydl.download([video['video_url']])
+
+        logger.debug("Successfully downloaded: %s", video['title'])
+        self._c_dl_success.inc()
+        return True
     
     def remove_from_playlist(self, playlist_item_id: str) -> bool:
         """
@@ -594,13 +814,14 @@ The video has been moved to the failed playlist and will no longer be retried.
             True if removal successful, False otherwise
         """
         try:
-            self.youtube.playlistItems().delete(id=playlist_item_id).execute()
-            
+            with self._api_lock:
+                self._playlist_items.delete(id=playlist_item_id).execute()
+
             # Track API usage
-            api_calls_total.labels(operation='delete').inc()
+            self._c_api_delete.inc()
             quota_tracker.add_usage('playlistItems.delete')
             
-            logger.info(f"Removed playlist item {playlist_item_id}")
+            logger.debug("Removed playlist item %s", playlist_item_id)
             return True
             
         except HttpError as e:
@@ -629,36 +850,196 @@ The video has been moved to the failed playlist and will no longer be retried.
                 }
             }
             
-            self.youtube.playlistItems().insert(
-                part='snippet',
-                body=request_body
-            ).execute()
-            
+            with self._api_lock:
+                self._playlist_items.insert(
+                    part='snippet',
+                    body=request_body
+                ).execute()
+
             # Track API usage
-            api_calls_total.labels(operation='insert').inc()
+            self._c_api_insert.inc()
             quota_tracker.add_usage('playlistItems.insert')
             
-            logger.info(f"Added video {video_id} to playlist {playlist_id}")
+            logger.debug("Added video %s to playlist %s", video_id, playlist_id)
             return True
             
         except HttpError as e:
             logger.error(f"Failed to add video {video_id} to playlist: {e}")
             return False
     
-    def process_video(self, video: Dict[str, str], download_path: Path) -> bool:
+    BATCH_SIZE = 50  # Max sub-requests per googleapiclient batch HTTP request
+
+    def _queue_insert(self, playlist_id: str, video_id: str, video: Dict[str, str]) -> None:
+        """Queue a playlistItems.insert for the end-of-cycle batch flush."""
+        request = self._playlist_items.insert(
+            part='snippet',
+            body={
+                'snippet': {
+                    'playlistId': playlist_id,
+                    'resourceId': {
+                        'kind': 'youtube#video',
+                        'videoId': video_id
+                    }
+                }
+            }
+        )
+        self._pending_batch_ops.append(('insert', request, video))
+
+    def _queue_delete(self, playlist_item_id: str, video: Dict[str, str]) -> None:
+        """Queue a playlistItems.delete for the end-of-cycle batch flush."""
+        request = self._playlist_items.delete(id=playlist_item_id)
+        self._pending_batch_ops.append(('delete', request, video))
+
+    def _on_batch_response(self, operation: str, video: Dict[str, str],
+                           request_id, response, exception) -> None:
+        """Per-sub-request callback for batched playlist mutations."""
+        if exception is not None:
+            if operation == 'insert':
+                logger.warning(f"Downloaded but failed to add to done playlist: {video['title']}: {exception}")
+            else:
+                logger.warning(f"Downloaded but failed to remove from todo playlist: {video['title']}: {exception}")
+            videos_processed_total.labels(status='api_failed').inc()
+            return
+
+        (self._c_api_insert if operation == 'insert' else self._c_api_delete).inc()
+        quota_tracker.add_usage(f'playlistItems.{operation}')
+        if operation == 'insert':
+            if self._done_playlist_ids is not None:
+                self._done_playlist_ids.add(video['video_id'])
+        if operation == 'delete':
+            logger.debug("Successfully processed: %s", video['title'])
+            videos_processed_total.labels(status='success').inc()
+
+    def _flush_batch(self) -> None:
+        """Flush queued playlist mutations as batched HTTP requests.
+
+        Packs up to BATCH_SIZE inserts/deletes into a single multipart
+        call instead of one HTTPS round-trip per operation.
+        """
+        if not self._pending_batch_ops:
+            return
+
+        ops = self._pending_batch_ops
+        self._pending_batch_ops = []
+        logger.info(f"Flushing {len(ops)} queued playlist mutation(s)")
+
+        for start in range(0, len(ops), self.BATCH_SIZE):
+            batch = self.youtube.new_batch_http_request()
+            for operation, request, video in ops[start:start + self.BATCH_SIZE]:
+                batch.add(request, callback=partial(self._on_batch_response, operation, video))
+            try:
+                with self._api_lock:
+                    batch.execute()
+            except HttpError as e:
+                logger.error(f"Batch playlist update failed: {e}")
+
+    def _precheck_availability(self, videos: List[Dict[str, str]]) -> None:
+        """Flag videos yt-dlp is guaranteed to fail on before downloading.
+
+        One videos.list call per 50 ids (1 quota unit each) surfaces
+        private, deleted and age-restricted videos. Flagged videos skip
+        the network download but still fail through download_video's
+        normal retry machinery, so they accumulate attempts and move to
+        the failed playlist at the threshold instead of sitting in the
+        todo playlist forever.
+        """
+        # Already-downloaded videos only need the playlist move
+        ids = [v['video_id'] for v in videos
+               if not (self._done_cache and v['video_id'] in self._done_cache)]
+        details = {}
+        try:
+            for start in range(0, len(ids), 50):
+                chunk = ids[start:start + 50]
+                with self._m_api_call.time():
+                    with self._api_lock:
+                        response = self.youtube.videos().list(
+                            part='status,contentDetails',
+                            id=','.join(chunk),
+                            maxResults=50,
+                            fields='items(id,status/privacyStatus,contentDetails/contentRating/ytRating)'
+                        ).execute()
+                quota_tracker.add_usage('videos.list')
+                for item in response.get('items', []):
+                    details[item['id']] = item
+        except HttpError as e:
+            logger.warning(f"videos.list pre-check failed - attempting all downloads: {e}")
+            self._precheck_rejects = {}
+            return
+
+        rejects = {}
+        for video_id in ids:
+            item = details.get(video_id)
+            if item is None:
+                rejects[video_id] = 'deleted or inaccessible'
+                continue
+            status = item.get('status', {})
+            rating = item.get('contentDetails', {}).get('contentRating', {})
+            if status.get('privacyStatus') == 'private':
+                rejects[video_id] = 'private'
+            elif rating.get('ytRating') == 'ytAgeRestricted' and not (COOKIES_FILE or COOKIES_CONTENT):
+                rejects[video_id] = 'age-restricted (no cookies configured)'
+        self._precheck_rejects = rejects
+
+    def _load_done_cache(self, download_path: Path) -> None:
+        """Load the persistent set of already-downloaded video ids.
+
+        .done_ids survives restarts, so a video whose playlist move
+        failed last cycle is not re-downloaded — only its playlist
+        mutations are retried.
         """
-        Process a single video: download, remove from todo, add to done.
+        if self._done_cache is not None:
+            return
+        with self._done_lock:
+            if self._done_cache is not None:
+                return
+            self._done_ids_file = download_path / '.done_ids'
+            try:
+                done_cache = set(self._done_ids_file.read_text().split())
+            except FileNotFoundError:
+                done_cache = set()
+            self._done_cache = done_cache
+        if self._done_cache:
+            logger.info(f"Loaded {len(self._done_cache)} completed video id(s) from {self._done_ids_file}")
+
+    def _mark_done(self, video_id: str) -> None:
+        """Record a completed download in the persistent done index."""
+        with self._done_lock:
+            if video_id in self._done_cache:
+                return
+            self._done_cache.add(video_id)
+            with open(self._done_ids_file, 'a') as f:
+                f.write(video_id + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+
+    def _in_retry_cooldown(self, video_id: str) -> bool:
+        """Check whether a video is waiting out its retry backoff."""
+        state = self.retry_state.get(video_id)
+        return bool(state) and time.time() < state['next_retry']
+
+    def _download_stage(self, video: Dict[str, str], download_path: Path):
+        """
+        Download stage of the processing pipeline.
         Skips videos that are in retry cooldown period.
-        
+
         Args:
             video: Video dictionary with metadata
             download_path: Directory to save downloaded videos
-            
+
         Returns:
-            True if entire process successful, False otherwise, None if skipped
+            Result of download_video, or None if skipped (in cooldown)
         """
         video_id = video['video_id']
-        
+
+        # run_once pre-loads this; direct process_video callers get it here
+        self._load_done_cache(download_path)
+
+        # Already on disk from a previous cycle whose playlist move
+        # failed: skip the download and just retry the mutations
+        if video_id in self._done_cache:
+            logger.debug("Already downloaded %s - retrying playlist move only", video['title'])
+            return True
+
         # Check if video is in retry cooldown
         if video_id in self.retry_state:
             state = self.retry_state[video_id]
@@ -673,105 +1054,249 @@ The video has been moved to the failed playlist and will no longer be retried.
                 return None  # None indicates skipped
             else:
                 # Cooldown expired - proceed with retry
-                logger.info(f"Retry cooldown expired for {video['title']} - attempting download (attempt {state['attempt'] + 1})")
-        
-        logger.info(f"Processing video: {video['title']}")
-        
-        # Step 1: Download video
-        download_result = self.download_video(video, download_path)
+                logger.debug("Retry cooldown expired for %s - attempting download (attempt %d)", video['title'], state['attempt'] + 1)
+
+        logger.debug("Processing video: %s", video['title'])
+
+        result = self.download_video(video, download_path)
+        if result is True:
+            self._mark_done(video_id)
+        return result
+
+    def _finalize_stage(self, video: Dict[str, str], download_result) -> bool:
+        """
+        Playlist-mutation stage of the pipeline: move a downloaded (or
+        permanently failed) video out of the todo playlist.
+
+        Args:
+            video: Video dictionary with metadata
+            download_result: Truthy result from the download stage
+
+        Returns:
+            True if entire process successful, False otherwise
+        """
         if download_result == 'permanent_failure':
             # Video moved to failed playlist, remove from todo
             if self.remove_from_playlist(video['playlist_item_id']):
                 logger.info(f"Removed permanently failed video from todo playlist: {video['title']}")
                 videos_processed_total.labels(status='permanent_failure').inc()
             return False
-        elif not download_result:
-            return False
-        
-        # Step 2: Add to done playlist
-        if not self.add_to_playlist(self.done_playlist_id, video['video_id']):
-            logger.warning(f"Downloaded but failed to add to done playlist: {video['title']}")
-            videos_processed_total.labels(status='api_failed').inc()
-            # Continue anyway - video is downloaded
-        
-        # Step 3: Remove from todo playlist
-        if not self.remove_from_playlist(video['playlist_item_id']):
-            logger.warning(f"Downloaded but failed to remove from todo playlist: {video['title']}")
-            videos_processed_total.labels(status='api_failed').inc()
-            return False
-        
-        logger.info(f"Successfully processed: {video['title']}")
-        videos_processed_total.labels(status='success').inc()
+
+        # Queue add-to-done and remove-from-todo for the end-of-cycle
+        # batch flush; per-operation outcome accounting happens in
+        # _on_batch_response
+        if self._done_playlist_ids and video['video_id'] in self._done_playlist_ids:
+            # Re-added to todo while already in done: skip the 50-unit
+            # duplicate insert and just remove it from todo
+            logger.debug("Already in done playlist: %s", video['title'])
+        else:
+            self._queue_insert(self.done_playlist_id, video['video_id'], video)
+        self._queue_delete(video['playlist_item_id'], video)
         return True
-    
-    def run_once(self, download_path: Path) -> None:
+
+    def process_video(self, video: Dict[str, str], download_path: Path) -> bool:
+        """
+        Process a single video end to end: download, remove from todo, add to done.
+
+        Args:
+            video: Video dictionary with metadata
+            download_path: Directory to save downloaded videos
+
+        Returns:
+            True if entire process successful, False otherwise, None if skipped
+        """
+        download_result = self._download_stage(video, download_path)
+        if download_result is None:
+            return None
+        if not download_result:
+            return False
+        result = self._finalize_stage(video, download_result)
+        self._flush_batch()
+        return result
+
+    def _download_stage_timed(self, video: Dict[str, str], download_path: Path):
+        """Run the download stage under the full-cycle duration histogram."""
+        with self._m_full_cycle.time():
+            return self._download_stage(video, download_path)
+
+    def run_once(self, download_path: Path, concurrency: int = DOWNLOAD_CONCURRENCY) -> int:
         """
         Process all videos in the todo playlist once.
-        
+
         Args:
             download_path: Directory to save downloaded videos
+            concurrency: Number of videos to download in parallel
+
+        Returns:
+            Number of videos processed or awaiting retry this cycle
+            (0 when the playlist was empty). Videos waiting out their
+            retry cooldown count as activity so the daemon's idle
+            backoff cannot stretch the sleep past the promised retry
+            schedule.
         """
-        logger.info("="*60)
-        logger.info("Starting playlist processing cycle")
-        logger.info(f"TODO Playlist ID: {self.todo_playlist_id}")
-        logger.info(f"DONE Playlist ID: {self.done_playlist_id}")
-        logger.info(f"Download Path: {download_path}")
-        logger.info(f"API Quota Used: {quota_tracker.used}/{DAILY_QUOTA_LIMIT} ({quota_tracker.get_remaining()} remaining)")
-        logger.info("="*60)
+        # One log call per banner: each emission takes the handler lock
+        # and formats a timestamp, so batch the lines
+        logger.info("\n".join([
+            "=" * 60,
+            "Starting playlist processing cycle",
+            f"TODO Playlist ID: {self.todo_playlist_id}",
+            f"DONE Playlist ID: {self.done_playlist_id}",
+            f"Download Path: {download_path}",
+            f"API Quota Used: {quota_tracker.used}/{DAILY_QUOTA_LIMIT} ({quota_tracker.get_remaining()} remaining)",
+            "=" * 60,
+        ]))
         
         cycle_start = time.time()
-        
-        # Ensure download directory exists
-        download_path.mkdir(parents=True, exist_ok=True)
-        
+
+        # Refresh credentials before they expire mid-cycle
+        self._ensure_fresh_credentials()
+
+        self._load_done_cache(download_path)
+
         # Fetch videos from todo playlist
         videos = self.get_playlist_videos(self.todo_playlist_id)
         
         if not videos:
             logger.info("No videos in todo playlist")
             last_processing_timestamp.set(time.time())
-            return
+            return 0
         
         logger.info(f"Found {len(videos)} videos to process")
-        
-        # Process each video
-        skipped_count = 0
-        for video in videos:
-            try:
-                with processing_duration_seconds.labels(operation='full_cycle').time():
-                    result = self.process_video(video, download_path)
-                    if result is None:
+
+        # Seed the done-playlist id set once so _finalize_stage can skip
+        # 50-unit duplicate inserts for videos re-added to todo; after
+        # that _on_batch_response keeps it current on successful inserts,
+        # avoiding a re-walk of the ever-growing done playlist per cycle
+        if self._done_playlist_ids is None:
+            self._done_playlist_ids = {
+                v['video_id'] for v in self.get_playlist_videos(self.done_playlist_id)
+            }
+
+        # Change detector: anything that survived the previous cycle is
+        # either net-new or sitting out a retry cooldown. Cooldown items
+        # don't need a pool slot; everything else gets processed.
+        previously_known = self._known_items
+        self._known_items = {v['playlist_item_id'] for v in videos}
+        if previously_known:
+            new_count = sum(1 for v in videos if v['playlist_item_id'] not in previously_known)
+            if new_count:
+                logger.info(f"{new_count} new video(s) since last cycle")
+
+        cooldown_skipped = [v for v in videos if self._in_retry_cooldown(v['video_id'])]
+        videos = [v for v in videos if not self._in_retry_cooldown(v['video_id'])]
+
+        # Flag videos that can't be downloaded before spending bandwidth
+        if videos:
+            self._precheck_availability(videos)
+
+        # Pre-flight quota check: each processed video costs one insert
+        # plus one delete. Cap this cycle's work so we never cross the
+        # daily limit mid-cycle and strand half-moved videos on 403s.
+        per_video_cost = QUOTA_COSTS['playlistItems.insert'] + QUOTA_COSTS['playlistItems.delete']
+        max_videos = quota_tracker.get_remaining() // per_video_cost
+        if max_videos <= 0:
+            logger.warning(f"API quota exhausted ({quota_tracker.used}/{DAILY_QUOTA_LIMIT}) - deferring processing until the daily reset")
+            last_processing_timestamp.set(time.time())
+            return 0
+        if len(videos) > max_videos:
+            logger.warning(f"Remaining quota only covers {max_videos} of {len(videos)} video(s) - deferring the rest to a later cycle")
+            videos = videos[:max_videos]
+
+        # Two-stage pipeline: the executor downloads videos concurrently
+        # (IO-bound) while a single finalizer thread performs the playlist
+        # add/remove API calls, overlapping download time with API
+        # round-trips instead of serializing them per video
+        skipped_count = len(cooldown_skipped)
+        finalize_queue = queue.Queue(maxsize=2 * concurrency)
+
+        def _finalizer():
+            while True:
+                item = finalize_queue.get()
+                if item is None:
+                    break
+                queued_video, download_result = item
+                try:
+                    if not self._finalize_stage(queued_video, download_result):
+                        videos_processed_total.labels(status='download_failed').inc()
+                except Exception as e:
+                    logger.error(f"Unexpected error finalizing {queued_video['title']}: {e}")
+                    videos_processed_total.labels(status='download_failed').inc()
+
+        finalizer = Thread(target=_finalizer, daemon=True)
+        finalizer.start()
+
+        try:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                futures = {
+                    executor.submit(self._download_stage_timed, video, download_path): video
+                    for video in videos
+                }
+                for future in as_completed(futures):
+                    video = futures[future]
+                    try:
+                        download_result = future.result()
+                    except Exception as e:
+                        logger.error(f"Unexpected error processing {video['title']}: {e}")
+                        videos_processed_total.labels(status='download_failed').inc()
+                        continue
+                    if download_result is None:
                         # Video skipped (in cooldown)
                         skipped_count += 1
-                    elif not result:
+                    elif not download_result:
                         videos_processed_total.labels(status='download_failed').inc()
-            except Exception as e:
-                logger.error(f"Unexpected error processing {video['title']}: {e}")
-                videos_processed_total.labels(status='download_failed').inc()
-                # Continue with next video
+                    else:
+                        finalize_queue.put((video, download_result))
+        finally:
+            finalize_queue.put(None)  # Sentinel: no more downloads this cycle
+            finalizer.join()
+            self._flush_batch()
         
         cycle_duration = time.time() - cycle_start
-        logger.info(f"Playlist processing cycle complete (took {cycle_duration:.1f}s)")
+        summary = [f"Playlist processing cycle complete (took {cycle_duration:.1f}s)"]
         if skipped_count > 0:
-            logger.info(f"Skipped {skipped_count} video(s) in retry cooldown")
-        logger.info(f"API Quota Used: {quota_tracker.used}/{DAILY_QUOTA_LIMIT} ({quota_tracker.get_remaining()} remaining)")
+            summary.append(f"Skipped {skipped_count} video(s) in retry cooldown")
+        summary.append(f"API Quota Used: {quota_tracker.used}/{DAILY_QUOTA_LIMIT} ({quota_tracker.get_remaining()} remaining)")
+        logger.info("\n".join(summary))
         last_processing_timestamp.set(time.time())
-    
-    def run_daemon(self, download_path: Path, poll_interval: int) -> None:
+        return len(videos) + len(cooldown_skipped)
+
+    def run_daemon(self, download_path: Path, poll_interval: int, concurrency: int = DOWNLOAD_CONCURRENCY) -> None:
         """
         Run continuously, checking for new videos periodically.
-        
+        Polling backs off exponentially while the playlist is idle and
+        snaps back to poll_interval as soon as there is work.
+
         Args:
             download_path: Directory to save downloaded videos
-            poll_interval: Seconds between checks
+            poll_interval: Seconds between checks (minimum, when active)
+            concurrency: Number of videos to download in parallel
         """
         logger.info(f"Starting daemon mode (checking every {poll_interval} seconds)")
-        
+        max_interval = POLL_INTERVAL_MAX or poll_interval * 64
+        current_interval = poll_interval
+
+        # Event-driven wake-up: SIGUSR1 (e.g. from a webhook sidecar or
+        # an operator who just added videos) interrupts the idle backoff
+        # and triggers an immediate cycle
+        wake = Event()
+        try:
+            signal.signal(signal.SIGUSR1, lambda signum, frame: wake.set())
+        except ValueError:
+            pass  # Signals can only be registered from the main thread
+
         try:
             while True:
-                self.run_once(download_path)
-                logger.info(f"Sleeping for {poll_interval} seconds...")
-                time.sleep(poll_interval)
+                processed = self.run_once(download_path, concurrency)
+                if processed:
+                    current_interval = poll_interval
+                else:
+                    # Idle cycle - back off to save API quota
+                    current_interval = min(current_interval * 2, max_interval)
+                logger.info(f"Sleeping for {current_interval} seconds...")
+                if wake.wait(current_interval):
+                    wake.clear()
+                    current_interval = poll_interval
+                    logger.info("Woken by SIGUSR1 - checking playlist now")
                 
         except KeyboardInterrupt:
             logger.info("Daemon stopped by user")
@@ -788,43 +1313,44 @@ def validate_config() -> bool:
         True if configuration valid, False otherwise
     """
     errors = []
-    
-    logger.info("Validating configuration...")
-    
+    checks = ["Validating configuration..."]
+
     # Check for either CLIENT_SECRET_JSON or credentials file
     if CLIENT_SECRET_JSON:
-        logger.info(f"✓ CLIENT_SECRET_JSON environment variable set")
+        checks.append("✓ CLIENT_SECRET_JSON environment variable set")
         try:
-            json.loads(CLIENT_SECRET_JSON)
-            logger.info(f"✓ CLIENT_SECRET_JSON is valid JSON")
-        except json.JSONDecodeError:
+            _json_loads(CLIENT_SECRET_JSON)
+            checks.append("✓ CLIENT_SECRET_JSON is valid JSON")
+        except ValueError:
             errors.append("CLIENT_SECRET_JSON is not valid JSON")
-            logger.error(f"✗ CLIENT_SECRET_JSON contains invalid JSON")
+            checks.append("✗ CLIENT_SECRET_JSON contains invalid JSON")
     elif os.path.exists(CREDENTIALS_FILE):
-        logger.info(f"✓ Credentials file found: {CREDENTIALS_FILE}")
+        checks.append(f"✓ Credentials file found: {CREDENTIALS_FILE}")
     else:
         errors.append(f"No client credentials found (neither CLIENT_SECRET_JSON nor {CREDENTIALS_FILE})")
-        logger.error(f"✗ No client credentials found")
-        logger.error(f"  Either set CLIENT_SECRET_JSON env var or provide {CREDENTIALS_FILE}")
-    
+        checks.append("✗ No client credentials found")
+        checks.append(f"  Either set CLIENT_SECRET_JSON env var or provide {CREDENTIALS_FILE}")
+
     if not TODO_PLAYLIST_ID:
         errors.append("TODO_PLAYLIST_ID not set")
     else:
-        logger.info(f"✓ TODO_PLAYLIST_ID: {TODO_PLAYLIST_ID}")
-    
+        checks.append(f"✓ TODO_PLAYLIST_ID: {TODO_PLAYLIST_ID}")
+
     if not DONE_PLAYLIST_ID:
         errors.append("DONE_PLAYLIST_ID not set")
     else:
-        logger.info(f"✓ DONE_PLAYLIST_ID: {DONE_PLAYLIST_ID}")
-    
+        checks.append(f"✓ DONE_PLAYLIST_ID: {DONE_PLAYLIST_ID}")
+
+    # One log record per pass/fail report, not one per check
     if errors:
-        logger.error("Configuration errors:")
-        for error in errors:
-            logger.error(f"  - {error}")
-        logger.error("\nPlease fix these issues. See README.md for setup instructions")
+        checks.append("Configuration errors:")
+        checks.extend(f"  - {error}" for error in errors)
+        checks.append("\nPlease fix these issues. See README.md for setup instructions")
+        logger.error("\n".join(checks))
         return False
-    
-    logger.info("Configuration valid!")
+
+    checks.append("Configuration valid!")
+    logger.info("\n".join(checks))
     return True
 
 
@@ -850,6 +1376,12 @@ def main():
         default=POLL_INTERVAL,
         help=f'Seconds between checks in daemon mode (default: {POLL_INTERVAL})'
     )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=DOWNLOAD_CONCURRENCY,
+        help=f'Number of parallel video downloads (default: {DOWNLOAD_CONCURRENCY})'
+    )
     parser.add_argument(
         '--metrics-port',
         type=int,
@@ -858,7 +1390,11 @@ def main():
     )
     
     args = parser.parse_args()
-    
+
+    # Ensure download directory exists once at startup rather than
+    # stat'ing it on every poll cycle
+    args.download_path.mkdir(parents=True, exist_ok=True)
+
     # Dump configuration for debugging
     logger.info("=" * 60)
     logger.info("CONFIGURATION DUMP")
@@ -929,9 +1465,9 @@ def main():
     
     # Run
     if args.daemon:
-        manager.run_daemon(args.download_path, args.poll_interval)
+        manager.run_daemon(args.download_path, args.poll_interval, args.concurrency)
     else:
-        manager.run_once(args.download_path)
+        manager.run_once(args.download_path, args.concurrency)
 
 
 if __name__ == '__main__':